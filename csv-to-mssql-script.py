@@ -21,23 +21,50 @@ Options:
     --driver DRIVER       ODBC Driver (default: ODBC Driver 17 for SQL Server)
     --if-exists {fail,replace,append}
                           Action if table exists (default: fail)
-    --batch-size BATCHSIZE Size of batches for bulk insert (default: 1000)
+    --batch-size BATCHSIZE Size of batches for bulk insert (default: 10000)
+    --auto-batch          Size batches from the column count and row width
     --infer-types         Infer column types from data (default)
     --no-infer-types      Don't infer column types from data (use NVARCHAR for all)
     --encoding ENCODING   File encoding (default: utf-8)
-    --delimiter DELIMITER CSV delimiter (default: ,)
+    --delimiter DELIMITER CSV delimiter (default: detected from the file)
+    --engine {pyodbc,turbodbc,bulk}
+                          Insert engine; turbodbc binds NumPy columns, bulk
+                          stages a file for BULK INSERT/bcp (default: pyodbc)
+    --bulk-dir BULK_DIR   Directory readable by SQL Server for BULK INSERT
+                          (bcp is used from a local temp dir if omitted)
+    --switch-in           With --if-exists append, load a staging heap and
+                          ALTER TABLE ... SWITCH it into the target
+    --workers WORKERS     Parallel loaders for a new or empty table (default: 1)
 """
 
 import os
 import sys
 import argparse
+import csv
+import shutil
+import subprocess
+import tempfile
+import queue
+import threading
+import itertools
+import functools
+import re
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
 import pyodbc
 from sqlalchemy import create_engine, inspect, text
+try:
+    import turbodbc
+except ImportError:
+    turbodbc = None
 import urllib.parse
 import logging
 from datetime import datetime
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 # Set up logging
 logging.basicConfig(
@@ -46,6 +73,119 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Bytes handed to the Arrow CSV tokenizer per block
+READ_BLOCK_SIZE = 8 << 20
+
+# Characters of the file handed to csv.Sniffer, and the delimiters it may choose from
+SNIFF_SAMPLE_SIZE = 64 << 10
+SNIFF_DELIMITERS = ",;\t|"
+
+# Arrow type each SQL Server base type is bound as when inserting;
+# anything not listed here (including DECIMAL, which must stay exact)
+# is bound as a string for SQL Server to convert
+COLUMN_BINDINGS = {
+    "SMALLINT": pa.int64(),
+    "INT": pa.int64(),
+    "BIGINT": pa.int64(),
+    "FLOAT": pa.float64(),
+    "BIT": pa.bool_(),
+    "DATE": pa.date32(),
+    "DATETIME": pa.timestamp("us"),
+    "DATETIME2": pa.timestamp("us"),
+}
+
+# Overrides for writing bulk load files: BIT as 0/1, DATETIME to milliseconds
+BULK_FILE_TYPES = {
+    "BIT": pa.int8(),
+    "DATETIME": pa.timestamp("ms"),
+}
+
+# Characters not allowed in a sanitized identifier
+_RE_BADID = re.compile(r'[^0-9A-Za-z_]')
+
+# Cheap test for values worth handing to pd.to_datetime (year-first or year-last dates)
+_DATELIKE = re.compile(r'^(\d{4}[-/]\d{1,2}[-/]\d{1,2}|\d{1,2}[-/]\d{1,2}[-/]\d{4})')
+
+# Exact formats for ISO-style dates, so pd.to_datetime can skip format guessing
+_DATE_FORMATS = [
+    (re.compile(r'^\d{4}-\d{1,2}-\d{1,2}$'), '%Y-%m-%d'),
+    (re.compile(r'^\d{4}-\d{1,2}-\d{1,2} \d{1,2}:\d{2}:\d{2}$'), '%Y-%m-%d %H:%M:%S'),
+    (re.compile(r'^\d{4}-\d{1,2}-\d{1,2} \d{1,2}:\d{2}:\d{2}\.\d+$'), '%Y-%m-%d %H:%M:%S.%f'),
+    (re.compile(r'^\d{4}-\d{1,2}-\d{1,2}T\d{1,2}:\d{2}:\d{2}$'), '%Y-%m-%dT%H:%M:%S'),
+    (re.compile(r'^\d{4}-\d{1,2}-\d{1,2}T\d{1,2}:\d{2}:\d{2}\.\d+$'), '%Y-%m-%dT%H:%M:%S.%f'),
+]
+
+# Whole numbers, recognized lexically so long ones are not rounded through float
+_INTEGER = re.compile(r'[-+]?[0-9]+')
+
+# SQL Server integer type for each width to_numeric can downcast to
+_INTEGER_TYPES = {1: "SMALLINT", 2: "SMALLINT", 4: "INT", 8: "BIGINT"}
+
+# Values accepted as booleans for BIT columns
+_BOOL_STRINGS = frozenset({'true', 'false', '1', '0', 'yes', 'no'})
+
+# SQL Server reserved keywords, which must be bracketed when used as identifiers
+_RESERVED = frozenset({
+    'add', 'all', 'alter', 'and', 'any', 'as', 'asc', 'authorization',
+    'backup', 'begin', 'between', 'break', 'browse', 'bulk', 'by',
+    'cascade', 'case', 'check', 'checkpoint', 'close', 'clustered',
+    'coalesce', 'collate', 'column', 'commit', 'compute', 'constraint',
+    'contains', 'containstable', 'continue', 'convert', 'create', 'cross',
+    'current', 'current_date', 'current_time', 'current_timestamp',
+    'current_user', 'cursor', 'database', 'dbcc', 'deallocate',
+    'declare', 'default', 'delete', 'deny', 'desc', 'disk', 'distinct',
+    'distributed', 'double', 'drop', 'dump', 'else', 'end', 'errlvl',
+    'escape', 'except', 'exec', 'execute', 'exists', 'exit', 'external',
+    'fetch', 'file', 'fillfactor', 'for', 'foreign', 'freetext',
+    'freetexttable', 'from', 'full', 'function', 'goto', 'grant',
+    'group', 'having', 'holdlock', 'identity', 'identity_insert',
+    'identitycol', 'if', 'in', 'index', 'inner', 'insert', 'intersect',
+    'into', 'is', 'join', 'key', 'kill', 'left', 'like', 'lineno',
+    'load', 'merge', 'national', 'nocheck', 'nonclustered', 'not',
+    'null', 'nullif', 'of', 'off', 'offsets', 'on', 'open',
+    'opendatasource', 'openquery', 'openrowset', 'openxml', 'option',
+    'or', 'order', 'outer', 'over', 'percent', 'pivot', 'plan',
+    'precision', 'primary', 'print', 'proc', 'procedure', 'public',
+    'raiserror', 'read', 'readtext', 'reconfigure', 'references',
+    'replication', 'restore', 'restrict', 'return', 'revert', 'revoke',
+    'right', 'rollback', 'rowcount', 'rowguidcol', 'rule', 'save',
+    'schema', 'securityaudit', 'select', 'semantickeyphrasetable',
+    'semanticsimilaritydetailstable', 'semanticsimilaritytable',
+    'session_user', 'set', 'setuser', 'shutdown', 'some', 'statistics',
+    'system_user', 'table', 'tablesample', 'textsize', 'then', 'to',
+    'top', 'tran', 'transaction', 'trigger', 'truncate', 'try_convert',
+    'tsequal', 'union', 'unique', 'unpivot', 'update', 'updatetext',
+    'use', 'user', 'values', 'varying', 'view', 'waitfor', 'when',
+    'where', 'while', 'with', 'within', 'writetext'
+})
+
+# Rows per batch committed by BULK INSERT / bcp
+BULK_BATCH_SIZE = 100000
+
+# SQL Server's limit on parameters in a single statement
+MAX_STATEMENT_PARAMS = 2100
+
+# Memory allowed for one batch of rows when sizing batches automatically
+AUTO_BATCH_MEMORY_BUDGET = 256 << 20
+
+# Rows inserted between commits
+COMMIT_EVERY_ROWS = 10 * 1000000
+
+# Parsed batches buffered ahead of the inserting thread
+PREFETCH_BATCHES = 2
+
+# Marks the end of a prefetch queue
+_END_OF_BATCHES = object()
+
+def detect_date_format(value):
+    """
+    Return the strptime format matching an ISO-style date string, or None.
+    """
+    for pattern, date_format in _DATE_FORMATS:
+        if pattern.match(value):
+            return date_format
+    return None
+
 def infer_sql_server_type(column_values):
     """
     Infer SQL Server data type from a pandas Series of values.
@@ -56,69 +196,84 @@ def infer_sql_server_type(column_values):
     if len(sample) == 0:
         return "NVARCHAR(255)"
     
-    # Check if all values are numeric
-    try:
-        if pd.to_numeric(sample, errors='coerce').notna().all():
-            # Check if all values are integers
-            if pd.Series([float(x).is_integer() for x in sample if pd.notna(x)]).all():
-                # Check range for appropriate integer size
-                min_val = min(sample.astype(float))
-                max_val = max(sample.astype(float))
-                
-                if min_val >= -32768 and max_val <= 32767:
-                    return "SMALLINT"
-                elif min_val >= -2147483648 and max_val <= 2147483647:
-                    return "INT"
-                else:
-                    return "BIGINT"
-            else:
-                # Decimal values
-                # Determine precision and scale
-                max_str_len = max(sample.astype(str).str.len())
-                if max_str_len <= 15:  # Standard float range
-                    return "FLOAT"
-                else:
-                    # Use DECIMAL with appropriate precision
-                    max_before_decimal = max(sample.astype(str).str.split('.').str[0].str.len())
-                    
-                    # Get max digits after decimal
-                    max_after_decimal = 0
-                    for val in sample:
-                        if pd.notna(val) and '.' in str(val):
-                            after_decimal = len(str(val).split('.')[1])
-                            max_after_decimal = max(max_after_decimal, after_decimal)
-                    
-                    # SQL Server's DECIMAL has max precision of 38
-                    precision = min(38, max_before_decimal + max_after_decimal)
-                    scale = min(max_after_decimal, precision - max_before_decimal)
+    # Profile the sample once: string form, lengths and numeric parse are
+    # shared by every check below instead of being recomputed per branch
+    as_str = sample.astype(str)
+    lengths = as_str.str.len()
+    max_len = lengths.max()
+    
+    # Check if all values are integers, and size them by the narrowest dtype they fit
+    if as_str.str.fullmatch(_INTEGER).all():
+        ints = pd.to_numeric(as_str, downcast='integer')
+        if ints.dtype.kind == 'i':
+            return _INTEGER_TYPES[ints.dtype.itemsize]
+        # Beyond BIGINT, keep values exact as DECIMAL while they fit its 38 digits
+        digits = int((lengths - as_str.str.match('[-+]')).max())
+        if digits <= 38:
+            return f"DECIMAL({digits}, 0)"
+    else:
+        # Check if all values are numeric
+        try:
+            nums = pd.to_numeric(as_str, errors='coerce')
+            if nums.notna().all():
+                # Check if all values are integers (an integer dtype already says so)
+                if nums.dtype.kind in 'iu' or ((nums % 1) == 0).all():
+                    # Check range for appropriate integer size
+                    min_val = nums.min()
+                    max_val = nums.max()
                     
-                    return f"DECIMAL({precision}, {scale})"
-    except:
-        pass
+                    if min_val >= -32768 and max_val <= 32767:
+                        return "SMALLINT"
+                    elif min_val >= -2147483648 and max_val <= 2147483647:
+                        return "INT"
+                    else:
+                        return "BIGINT"
+                else:
+                    # Decimal values
+                    # Determine precision and scale
+                    if max_len <= 15:  # Standard float range
+                        return "FLOAT"
+                    else:
+                        # Use DECIMAL with appropriate precision; digits either side
+                        # of the point come from its position, without splitting strings
+                        dots = as_str.str.find('.')
+                        has_dot = dots >= 0
+                        max_before_decimal = dots.where(has_dot, lengths).max()
+                        
+                        # Get max digits after decimal
+                        max_after_decimal = (lengths - dots - 1).where(has_dot, 0).max()
+                        
+                        # SQL Server's DECIMAL has max precision of 38
+                        precision = min(38, max_before_decimal + max_after_decimal)
+                        scale = min(max_after_decimal, precision - max_before_decimal)
+                        
+                        return f"DECIMAL({precision}, {scale})"
+        except:
+            pass
     
-    # Check if all values are dates
-    try:
-        date_series = pd.to_datetime(sample, errors='coerce')
-        if date_series.notna().all():
-            # Check if any times are non-midnight
-            if any(date_series.dt.time != pd.Timestamp('00:00:00').time()):
-                # Check for microseconds
-                if any(date_series.dt.microsecond > 0):
-                    return "DATETIME2"
+    # Check if all values are dates, unless the first one clearly isn't
+    first_value = as_str.iat[0]
+    if _DATELIKE.match(first_value):
+        try:
+            date_series = pd.to_datetime(as_str, format=detect_date_format(first_value), errors='coerce')
+            if date_series.notna().all():
+                # Check if any times are non-midnight
+                if (date_series != date_series.dt.normalize()).any():
+                    # Check for microseconds
+                    if (date_series.dt.microsecond > 0).any():
+                        return "DATETIME2"
+                    else:
+                        return "DATETIME"
                 else:
-                    return "DATETIME"
-            else:
-                return "DATE"
-    except:
-        pass
+                    return "DATE"
+        except:
+            pass
     
     # Check if all values are booleans
-    if set(sample.astype(str).str.lower()) <= {'true', 'false', '1', '0', 'yes', 'no'}:
+    if as_str.str.lower().isin(_BOOL_STRINGS).all():
         return "BIT"
     
     # Default to string types, with appropriate length
-    max_len = sample.astype(str).str.len().max()
-    
     # For very short strings
     if max_len <= 1:
         return "CHAR(1)"
@@ -131,6 +286,424 @@ def infer_sql_server_type(column_values):
     else:
         return "NVARCHAR(MAX)"
 
+def sniff_dialect(csv_path, encoding="utf-8"):
+    """
+    Guess the delimiter and quote character from the start of the CSV file.
+    Falls back to a comma and double quotes if the sample is ambiguous.
+    """
+    with open(csv_path, newline="", encoding=encoding) as f:
+        sample = f.read(SNIFF_SAMPLE_SIZE)
+    # Only sniff whole lines, as a truncated last row can skew the guess
+    if len(sample) == SNIFF_SAMPLE_SIZE and "\n" in sample:
+        sample = sample[:sample.rindex("\n") + 1]
+    try:
+        dialect = csv.Sniffer().sniff(sample, delimiters=SNIFF_DELIMITERS)
+        return dialect.delimiter, dialect.quotechar or '"'
+    except csv.Error:
+        return ",", '"'
+
+def read_header(csv_path, encoding="utf-8", delimiter=",", quote_char='"'):
+    """
+    Read just the header row of the CSV file.
+    """
+    with open(csv_path, newline="", encoding=encoding) as f:
+        header = next(csv.reader(f, delimiter=delimiter, quotechar=quote_char), [])
+    if header:
+        header[0] = header[0].lstrip("\ufeff")
+    return header
+
+def open_csv_reader(csv_path, encoding="utf-8", delimiter=",", quote_char='"', column_names=None,
+                    skip_header=True):
+    """
+    Open a streaming Arrow reader over the CSV file (a path or an Arrow stream).
+    Empty cells are read as NULL, matching pandas. If column_names is given,
+    the header row is skipped (unless skip_header is False), the batches carry
+    those names instead, and every column is read as text. This way Arrow's
+    guess from the first block never becomes a schema that later blocks can fail.
+    """
+    if column_names:
+        read_options = pacsv.ReadOptions(block_size=READ_BLOCK_SIZE, encoding=encoding,
+                                         column_names=column_names, skip_rows=1 if skip_header else 0)
+        column_types = dict.fromkeys(column_names, pa.string())
+    else:
+        read_options = pacsv.ReadOptions(block_size=READ_BLOCK_SIZE, encoding=encoding)
+        column_types = None
+    return pacsv.open_csv(
+        csv_path,
+        read_options=read_options,
+        parse_options=pacsv.ParseOptions(delimiter=delimiter, quote_char=quote_char,
+                                         newlines_in_values=True),
+        convert_options=pacsv.ConvertOptions(strings_can_be_null=True, column_types=column_types)
+    )
+
+def split_byte_ranges(csv_path, parts, quote_char='"'):
+    """
+    Split the file into at most `parts` contiguous (start, end) byte ranges
+    that each end at a line break outside quotes, so every range parses on its
+    own even when quoted values span lines. Quote parity is tracked over the
+    whole file, since a line break inside quotes looks like any other.
+    """
+    size = os.path.getsize(csv_path)
+    quote = quote_char.encode("ascii")
+    targets = [size * i // parts for i in range(1, parts)]
+    bounds = [0]
+    in_quotes = False
+    offset = 0
+    with open(csv_path, "rb") as f:
+        while targets:
+            chunk = f.read(READ_BLOCK_SIZE)
+            if not chunk:
+                break
+            pos = 0
+            while targets:
+                newline = chunk.find(b"\n", max(pos, targets[0] - offset))
+                if newline < 0:
+                    break
+                # An odd number of quotes since the last line break flips the state
+                in_quotes ^= chunk.count(quote, pos, newline) % 2 == 1
+                pos = newline + 1
+                if in_quotes:
+                    continue
+                bound = offset + pos
+                if bound >= size:
+                    targets = []
+                    break
+                bounds.append(bound)
+                targets = [target for target in targets if target >= bound]
+            in_quotes ^= chunk.count(quote, pos) % 2 == 1
+            offset += len(chunk)
+    bounds.append(size)
+    return list(zip(bounds[:-1], bounds[1:]))
+
+def iter_batches(batches, batch_size):
+    """
+    Re-chunk a stream of RecordBatches into batches of batch_size rows (the
+    last one may be shorter). Large blocks are sliced zero-copy and small
+    ones are combined, so batch size does not depend on the block size.
+    """
+    parts = []
+    pending_rows = 0
+    for batch in batches:
+        offset = 0
+        while offset < batch.num_rows:
+            take = min(batch_size - pending_rows, batch.num_rows - offset)
+            parts.append(batch.slice(offset, take))
+            pending_rows += take
+            offset += take
+            if pending_rows == batch_size:
+                yield combine_batches(parts)
+                parts = []
+                pending_rows = 0
+    if pending_rows:
+        yield combine_batches(parts)
+
+def combine_batches(parts):
+    """
+    Concatenate RecordBatches sharing a schema into a single RecordBatch.
+    """
+    if len(parts) == 1:
+        return parts[0]
+    return pa.Table.from_batches(parts).combine_chunks().to_batches()[0]
+
+def prefetch_batches(batches, maxsize=PREFETCH_BATCHES):
+    """
+    Pull batches on a background thread so CSV parsing overlaps with inserts.
+    At most maxsize parsed batches wait in memory; reader errors are re-raised
+    in the consuming thread. Closing the generator early stops the producer
+    and waits for it, so the reader can be closed safely afterwards.
+    """
+    pending = queue.Queue(maxsize=maxsize)
+    errors = []
+    stop = threading.Event()
+    
+    def produce():
+        try:
+            for batch in batches:
+                if stop.is_set():
+                    break
+                pending.put(batch)
+        except Exception as e:
+            errors.append(e)
+        finally:
+            pending.put(_END_OF_BATCHES)
+    
+    producer = threading.Thread(target=produce, name="csv-reader", daemon=True)
+    producer.start()
+    try:
+        while True:
+            batch = pending.get()
+            if batch is _END_OF_BATCHES:
+                break
+            yield batch
+    finally:
+        # Drain the queue so a put blocked on a full queue returns, then wait
+        # for the producer to see the stop flag and leave the reader
+        stop.set()
+        while producer.is_alive():
+            try:
+                while True:
+                    pending.get_nowait()
+            except queue.Empty:
+                pass
+            producer.join(timeout=0.1)
+    if errors:
+        raise errors[0]
+
+def auto_batch_size(num_columns, row_bytes):
+    """
+    Choose rows per batch so each round trip binds a large parameter array
+    while one batch stays within AUTO_BATCH_MEMORY_BUDGET.
+    """
+    rows_per_batch = max(1000, min(50000, MAX_STATEMENT_PARAMS // max(1, num_columns) * 20))
+    return max(1, min(rows_per_batch, AUTO_BATCH_MEMORY_BUDGET // max(1, row_bytes)))
+
+def text_sample(column):
+    """
+    Render an Arrow column as a pandas Series of strings for type inference.
+    """
+    return column.cast(pa.string()).to_pandas()
+
+def binding_type_for(sql_type):
+    """
+    Return the Arrow type used to bind values of a SQL Server column type.
+    """
+    return COLUMN_BINDINGS.get(sql_type.split("(")[0], pa.string())
+
+def cast_text(column, arrow_type):
+    """
+    Cast a text column to arrow_type; integers written like 1.0 or +7 are
+    parsed through float64. Raises ArrowInvalid if any value does not convert.
+    """
+    try:
+        return column.cast(arrow_type)
+    except pa.ArrowInvalid:
+        if not pa.types.is_integer(arrow_type):
+            raise
+        return column.cast(pa.float64()).cast(arrow_type)
+
+def convert_batch(batch, bindings):
+    """
+    Convert a RecordBatch read as text to the binding types of its columns.
+    A column that does not convert in this batch is left as text, for SQL
+    Server to convert or reject, instead of failing the import.
+    """
+    columns = []
+    for name, column, binding in zip(batch.schema.names, batch.columns, bindings):
+        if binding != pa.string() and pa.types.is_string(column.type):
+            try:
+                column = cast_text(column, binding)
+            except pa.ArrowInvalid:
+                logger.warning(f"Column '{name}' has values that are not {binding} in this batch; sending them as text")
+        columns.append(column)
+    return pa.RecordBatch.from_arrays(columns, names=batch.schema.names)
+
+def to_rows(batch, bindings):
+    """
+    Convert a RecordBatch into the list of row tuples bound by executemany.
+    Text columns are bound as strings whatever Arrow parsed them as.
+    """
+    columns = [
+        column.cast(pa.string()) if binding == pa.string() else column
+        for column, binding in zip(batch.columns, bindings)
+    ]
+    # Zip whole columns into row tuples for fast insertion; this beats
+    # DataFrame itertuples/to_numpy().tolist(), and the list is kept because
+    # fast_executemany only binds a sequence as one parameter array
+    # (an iterator falls back to row-by-row execution)
+    return list(zip(*(column.to_pylist() for column in columns)))
+
+def to_masked_array(column, binding_type):
+    """
+    Convert an Arrow column into a NumPy masked array for turbodbc's
+    executemanycolumns, with NULLs masked out.
+    """
+    mask = column.is_null().to_numpy(zero_copy_only=False)
+    if pa.types.is_string(column.type):
+        # Text left unconverted by convert_batch is bound as strings
+        binding_type = pa.string()
+    column = column.cast(binding_type, safe=False)
+    if binding_type != pa.string():
+        # Fill NULLs so the buffer keeps a native dtype; the mask hides them
+        fill_value = False if pa.types.is_boolean(binding_type) else 0
+        column = column.fill_null(pa.scalar(fill_value, type=binding_type))
+    return np.ma.MaskedArray(column.to_numpy(zero_copy_only=False), mask=mask)
+
+def to_bulk_column(column, sql_type):
+    """
+    Convert an Arrow column to the representation written to a bulk load file.
+    Text is written as read and left for SQL Server to convert.
+    """
+    if pa.types.is_string(column.type):
+        return column
+    column = column.cast(binding_type_for(sql_type), safe=False)
+    file_type = BULK_FILE_TYPES.get(sql_type.split("(")[0])
+    return column.cast(file_type, safe=False) if file_type else column
+
+def to_tab_delimited(batch):
+    """
+    Render a RecordBatch as the unquoted, tab-delimited lines bcp character
+    mode reads. Quotes pass through as data; tabs and line breaks cannot, so they raise.
+    """
+    columns = [column.cast(pa.string()) for column in batch.columns]
+    for name, column in zip(batch.schema.names, columns):
+        if pc.any(pc.match_substring_regex(column, "[\t\n]")).as_py():
+            raise ValueError(
+                f"Column '{name}' has values containing tabs or line breaks, which bcp cannot load; "
+                f"use --bulk-dir to load with BULK INSERT, or --engine pyodbc"
+            )
+    lines = pc.binary_join_element_wise(*columns, "\t", null_handling="replace", null_replacement="")
+    lines = pc.binary_join_element_wise(lines, "", "\n")
+    # The joined lines are contiguous in the array's data buffer
+    end = np.frombuffer(lines.buffers()[1], dtype=np.int32)[lines.offset + len(lines)]
+    return lines.buffers()[2][:end]
+
+def bcp_command(connection_string, target, data_path):
+    """
+    Build the bcp command line that loads a tab-delimited file into target.
+    """
+    attributes = {}
+    for part in connection_string.split(";"):
+        if "=" in part:
+            key, value = part.split("=", 1)
+            attributes[key.strip().upper()] = value
+    
+    command = [
+        "bcp", target, "in", data_path,
+        "-S", attributes["SERVER"], "-d", attributes["DATABASE"],
+        "-c", "-t", "\\t", "-r", "0x0a",
+        "-b", str(BULK_BATCH_SIZE), "-h", "TABLOCK"
+    ]
+    if "UID" in attributes:
+        command += ["-U", attributes["UID"], "-P", attributes.get("PWD", "")]
+    else:
+        command.append("-T")
+    if os.name == "nt":
+        # Windows bcp defaults to the OEM code page
+        command += ["-C", "65001"]
+    return command
+
+def bulk_load_batches(conn, connection_string, batches, schema, table_name,
+                      cleaned_columns, column_types, bulk_dir=None):
+    """
+    Stage batches in a delimited file and load it server-side in one operation.
+    
+    With bulk_dir (a directory SQL Server can also read, e.g. a UNC share) the
+    file is loaded with BULK INSERT; otherwise it is written to a local temp
+    directory and loaded with the bcp utility.
+    """
+    cursor = conn.cursor()
+    target = f"{quote_identifier(schema)}.{quote_identifier(table_name)}"
+    
+    # Identity values in a data file are ignored, so an empty field at the
+    # identity column's position lines the data up with the table; tables
+    # created by this script have [Id] last, but other tables may not
+    cursor.execute(
+        "SELECT (SELECT COUNT(*) FROM sys.columns c WHERE c.object_id = i.object_id AND c.column_id < i.column_id) "
+        "FROM sys.columns i WHERE i.object_id = OBJECT_ID(?) AND i.is_identity = 1",
+        target
+    )
+    identity_row = cursor.fetchone()
+    identity_position = identity_row[0] if identity_row else None
+    
+    # BULK INSERT parses RFC 4180 CSV; bcp character mode needs unquoted fields,
+    # which to_tab_delimited writes
+    write_options = pacsv.WriteOptions(include_header=False)
+    
+    staging_dir = tempfile.mkdtemp(dir=bulk_dir)
+    data_path = os.path.join(staging_dir, "data.csv")
+    total_rows = 0
+    writer = None
+    try:
+        start_stage = time.time()
+        for batch in batches:
+            arrays = [to_bulk_column(column, column_types[col]) for col, column in zip(cleaned_columns, batch.columns)]
+            names = list(cleaned_columns)
+            if identity_position is not None:
+                arrays.insert(identity_position, pa.nulls(batch.num_rows, pa.int8()))
+                names.insert(identity_position, "Id")
+            file_batch = pa.RecordBatch.from_arrays(arrays, names=names)
+            
+            if bulk_dir:
+                if writer is None:
+                    writer = pacsv.CSVWriter(data_path, file_batch.schema, write_options=write_options)
+                writer.write_batch(file_batch)
+            elif file_batch.num_rows:
+                if writer is None:
+                    writer = open(data_path, "wb")
+                writer.write(to_tab_delimited(file_batch))
+            total_rows += batch.num_rows
+        if writer is not None:
+            writer.close()
+        logger.info(f"Staged {total_rows} rows for bulk load in {time.time() - start_stage:.2f} seconds")
+        
+        if total_rows:
+            start_load = time.time()
+            if bulk_dir:
+                quoted_path = data_path.replace("'", "''")
+                cursor.execute(
+                    f"BULK INSERT {target} FROM '{quoted_path}' "
+                    f"WITH (FORMAT = 'CSV', FIELDTERMINATOR = ',', ROWTERMINATOR = '0x0a', "
+                    f"CODEPAGE = '65001', TABLOCK, BATCHSIZE = {BULK_BATCH_SIZE})"
+                )
+                conn.commit()
+            else:
+                result = subprocess.run(
+                    bcp_command(connection_string, target, data_path),
+                    capture_output=True, text=True
+                )
+                if result.returncode != 0:
+                    raise RuntimeError(f"bcp failed: {result.stdout.strip() or result.stderr.strip()}")
+            load_time = time.time() - start_load
+            logger.info(f"Bulk loaded {total_rows} rows in {load_time:.2f} seconds ({total_rows/load_time:.2f} rows/sec)")
+    finally:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+    
+    return total_rows
+
+def load_byte_range(connection_string, csv_path, byte_range, worker, insert_sql, bindings,
+                    batch_size, encoding, delimiter, quote_char, column_names, stop):
+    """
+    Parse one byte range of the CSV file and insert it over its own connection.
+    Returns the number of rows inserted. A failure sets the shared stop event,
+    and every worker stops at its next batch when it is set.
+    """
+    start, end = byte_range
+    conn = pyodbc.connect(connection_string)
+    conn.autocommit = False
+    cursor = conn.cursor()
+    cursor.fast_executemany = True
+    commit_every = max(1, COMMIT_EVERY_ROWS // batch_size)
+    total_rows = 0
+    try:
+        with pa.memory_map(csv_path) as source:
+            # Map the range zero-copy; only the first one starts with the header
+            source.seek(start)
+            reader = open_csv_reader(
+                pa.BufferReader(source.read_buffer(end - start)), encoding=encoding,
+                delimiter=delimiter, quote_char=quote_char, column_names=column_names,
+                skip_header=start == 0
+            )
+            for i, batch in enumerate(iter_batches(reader, batch_size)):
+                if stop.is_set():
+                    # Another worker failed; leave this range's open transaction uncommitted
+                    conn.rollback()
+                    return total_rows
+                start_batch = time.time()
+                cursor.executemany(insert_sql, to_rows(convert_batch(batch, bindings), bindings))
+                if (i + 1) % commit_every == 0:
+                    conn.commit()
+                total_rows += batch.num_rows
+                batch_time = time.time() - start_batch
+                logger.info(f"Worker {worker} batch {i+1}: Inserted {batch.num_rows} rows in {batch_time:.2f} seconds ({batch.num_rows/batch_time:.2f} rows/sec)")
+            conn.commit()
+    except Exception:
+        stop.set()
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+    return total_rows
+
 def create_connection_string(args):
     """Create SQLAlchemy connection string for SQL Server."""
     params = {}
@@ -155,124 +728,153 @@ def create_connection_string(args):
     # Create the SQLAlchemy connection string
     return f"mssql+pyodbc:///?odbc_connect={quoted_conn_str}"
 
+@functools.lru_cache(maxsize=None)
 def sanitize_identifier(name):
     """
     Sanitize SQL Server identifiers to prevent SQL injection and errors.
     """
     # Replace invalid characters with underscores
-    sanitized = ''.join(c if c.isalnum() or c == '_' else '_' for c in name)
+    sanitized = _RE_BADID.sub('_', name)
     
     # Ensure it doesn't start with a number
-    if sanitized and sanitized[0].isdigit():
+    if sanitized[:1].isdigit():
         sanitized = 'col_' + sanitized
     
     # Handle reserved keywords by adding brackets if needed
-    reserved_keywords = {
-        'add', 'all', 'alter', 'and', 'any', 'as', 'asc', 'authorization',
-        'backup', 'begin', 'between', 'break', 'browse', 'bulk', 'by',
-        'cascade', 'case', 'check', 'checkpoint', 'close', 'clustered',
-        'coalesce', 'collate', 'column', 'commit', 'compute', 'constraint',
-        'contains', 'containstable', 'continue', 'convert', 'create', 'cross',
-        'current', 'current_date', 'current_time', 'current_timestamp',
-        'current_user', 'cursor', 'database', 'dbcc', 'deallocate',
-        'declare', 'default', 'delete', 'deny', 'desc', 'disk', 'distinct',
-        'distributed', 'double', 'drop', 'dump', 'else', 'end', 'errlvl',
-        'escape', 'except', 'exec', 'execute', 'exists', 'exit', 'external',
-        'fetch', 'file', 'fillfactor', 'for', 'foreign', 'freetext',
-        'freetexttable', 'from', 'full', 'function', 'goto', 'grant',
-        'group', 'having', 'holdlock', 'identity', 'identity_insert',
-        'identitycol', 'if', 'in', 'index', 'inner', 'insert', 'intersect',
-        'into', 'is', 'join', 'key', 'kill', 'left', 'like', 'lineno',
-        'load', 'merge', 'national', 'nocheck', 'nonclustered', 'not',
-        'null', 'nullif', 'of', 'off', 'offsets', 'on', 'open',
-        'opendatasource', 'openquery', 'openrowset', 'openxml', 'option',
-        'or', 'order', 'outer', 'over', 'percent', 'pivot', 'plan',
-        'precision', 'primary', 'print', 'proc', 'procedure', 'public',
-        'raiserror', 'read', 'readtext', 'reconfigure', 'references',
-        'replication', 'restore', 'restrict', 'return', 'revert', 'revoke',
-        'right', 'rollback', 'rowcount', 'rowguidcol', 'rule', 'save',
-        'schema', 'securityaudit', 'select', 'semantickeyphrasetable',
-        'semanticsimilaritydetailstable', 'semanticsimilaritytable',
-        'session_user', 'set', 'setuser', 'shutdown', 'some', 'statistics',
-        'system_user', 'table', 'tablesample', 'textsize', 'then', 'to',
-        'top', 'tran', 'transaction', 'trigger', 'truncate', 'try_convert',
-        'tsequal', 'union', 'unique', 'unpivot', 'update', 'updatetext',
-        'use', 'user', 'values', 'varying', 'view', 'waitfor', 'when',
-        'where', 'while', 'with', 'within', 'writetext'
-    }
-    
-    if sanitized.lower() in reserved_keywords:
+    if sanitized.lower() in _RESERVED:
         return f"[{sanitized}]"
     
     return sanitized
 
+def quote_identifier(name):
+    """
+    Sanitize an identifier and wrap it in brackets for use in SQL text.
+    """
+    sanitized = sanitize_identifier(name)
+    return sanitized if sanitized.startswith("[") else f"[{sanitized}]"
+
+def switch_in_blocker(cursor, target):
+    """
+    Return why a staging heap cannot be switched into the target table, or None if it can.
+    ALTER TABLE ... SWITCH needs an empty, unindexed and unconstrained target here.
+    """
+    # Check, foreign key, primary key and unique constraints of the quoted target
+    cursor.execute(
+        "SELECT COUNT(*) FROM sys.objects WHERE parent_object_id = OBJECT_ID(?) AND type IN ('C', 'F', 'PK', 'UQ')",
+        target
+    )
+    if cursor.fetchone()[0]:
+        return "it has constraints"
+    cursor.execute(
+        "SELECT OBJECTPROPERTY(OBJECT_ID(?), 'TableHasIndex'), OBJECTPROPERTY(OBJECT_ID(?), 'TableHasForeignRef')",
+        target, target
+    )
+    has_index, has_foreign_ref = cursor.fetchone()
+    if has_index:
+        return "it has indexes"
+    if has_foreign_ref:
+        return "it is referenced by a foreign key"
+    cursor.execute(f"SELECT TOP 1 1 FROM {target}")
+    if cursor.fetchone() is not None:
+        return "it is not empty"
+    return None
+
 def create_table_from_csv(engine, csv_path, table_name, schema="dbo", 
-                         if_exists="fail", batch_size=1000, infer_types=True,
-                         encoding="utf-8", delimiter=","):
+                         if_exists="fail", batch_size=10000, infer_types=True,
+                         encoding="utf-8", delimiter=None, insert_engine="pyodbc",
+                         bulk_dir=None, auto_batch=False, switch_in=False, workers=1):
     """
     Create a SQL Server table from a CSV file and import data.
     """
     start_time = datetime.now()
     
+    if insert_engine == "turbodbc" and turbodbc is None:
+        raise ImportError("turbodbc is required for --engine turbodbc (pip install turbodbc)")
+    
     # Create a connection directly with pyodbc for more control
     connection_url = engine.url
     connection_string = connection_url.query['odbc_connect']
     conn = pyodbc.connect(connection_string)
     cursor = conn.cursor()
     
-    # Read the first chunk to get column names and sample data for type inference
+    # Clean column names once from the header, so every batch is read under them
     logger.info(f"Reading CSV file: {csv_path}")
-    first_chunk = pd.read_csv(csv_path, nrows=batch_size, encoding=encoding, delimiter=delimiter, low_memory=False)
-    
-    # Clean column names
-    original_columns = first_chunk.columns
+    # Sniff the dialect once unless a delimiter was given
+    if delimiter is None:
+        delimiter, quote_char = sniff_dialect(csv_path, encoding=encoding)
+        logger.info(f"Detected delimiter {delimiter!r} and quote character {quote_char!r}")
+    else:
+        quote_char = '"'
+    original_columns = read_header(csv_path, encoding=encoding, delimiter=delimiter, quote_char=quote_char)
     cleaned_columns = [sanitize_identifier(col.strip()) for col in original_columns]
-    column_mapping = dict(zip(original_columns, cleaned_columns))
+    quoted_columns = [quote_identifier(col.strip()) for col in original_columns]
     
-    # Rename the columns in the dataframe
-    first_chunk.rename(columns=column_mapping, inplace=True)
+    # Read the first block to get sample data for type inference;
+    # the same block is inserted first, so the file is only parsed once
+    reader = open_csv_reader(csv_path, encoding=encoding, delimiter=delimiter,
+                             quote_char=quote_char, column_names=cleaned_columns)
+    try:
+        first_block = reader.read_next_batch()
+    except StopIteration:
+        first_block = pa.RecordBatch.from_pylist([], schema=reader.schema)
+    first_batch = first_block.slice(0, batch_size)
     
     # Set up SQL column types
     column_types = {}
     if infer_types:
         logger.info("Inferring SQL Server column types from data")
+        # Columns are independent and pandas drops the GIL in its vectorized kernels
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            inferred = executor.map(lambda column: infer_sql_server_type(text_sample(column)), first_batch.columns)
+            column_types = dict(zip(cleaned_columns, inferred))
         for col in cleaned_columns:
-            column_types[col] = infer_sql_server_type(first_chunk[col])
             logger.info(f"Column '{col}' inferred as {column_types[col]}")
     else:
         # Default all columns to NVARCHAR(255)
         for col in cleaned_columns:
             column_types[col] = "NVARCHAR(255)"
     
-    # Check if table exists
-    cursor.execute(f"""
-        SELECT COUNT(*) 
-        FROM INFORMATION_SCHEMA.TABLES 
-        WHERE TABLE_SCHEMA = '{schema}' AND TABLE_NAME = '{table_name}'
-    """)
-    table_exists = cursor.fetchone()[0] > 0
+    # Size batches from the table width and the sampled row width
+    row_bytes = first_batch.nbytes // max(1, first_batch.num_rows)
+    if auto_batch:
+        batch_size = auto_batch_size(len(cleaned_columns), row_bytes)
+        logger.info(f"Auto batch size: {batch_size} rows (~{row_bytes} bytes per row)")
+    
+    # Identifiers are sanitized before they are interpolated into any SQL
+    target = f"{quote_identifier(schema)}.{quote_identifier(table_name)}"
+    
+    # Check if table exists with a catalog lookup rather than an INFORMATION_SCHEMA scan
+    cursor.execute("SELECT CASE WHEN OBJECT_ID(?, 'U') IS NULL THEN 0 ELSE 1 END", target)
+    table_exists = bool(cursor.fetchone()[0])
     
     if table_exists and if_exists == "fail":
         logger.error(f"Table '{schema}.{table_name}' already exists. Use --if-exists option.")
+        reader.close()
         conn.close()
         sys.exit(1)
     elif table_exists and if_exists == "replace":
         logger.info(f"Dropping existing table '{schema}.{table_name}'")
-        cursor.execute(f"DROP TABLE [{schema}].[{table_name}]")
+        cursor.execute(f"DROP TABLE {target}")
         conn.commit()
         table_exists = False
     
     # Create table if it doesn't exist or we're replacing it
+    table_created = False
+    add_primary_key = False
     if not table_exists or if_exists == "replace":
-        # Generate the CREATE TABLE statement
-        create_table_sql = f"CREATE TABLE [{schema}].[{table_name}] (\n"
+        # Column names compare case-insensitively under the default collation,
+        # so a CSV column like 'id' would clash with the [Id] key after the load
+        add_primary_key = not any(col.lower() == "id" for col in cleaned_columns)
+        if not add_primary_key:
+            logger.warning(f"The CSV already has an 'Id' column; creating '{schema}.{table_name}' without the [Id] primary key")
         
-        # Add a numeric identity column as primary key
-        create_table_sql += "    [Id] INT IDENTITY(1,1) PRIMARY KEY,\n"
+        # Generate the CREATE TABLE statement; the [Id] primary key is added
+        # after the load so the rows go into an unindexed heap
+        create_table_sql = f"CREATE TABLE {target} (\n"
         
         # Add columns based on inferred or default types
-        for i, col in enumerate(cleaned_columns):
-            create_table_sql += f"    [{col}] {column_types[col]}"
+        for i, (col, quoted) in enumerate(zip(cleaned_columns, quoted_columns)):
+            create_table_sql += f"    {quoted} {column_types[col]}"
             if i < len(cleaned_columns) - 1:
                 create_table_sql += ",\n"
             else:
@@ -284,40 +886,175 @@ def create_table_from_csv(engine, csv_path, table_name, schema="dbo",
         logger.info(f"Creating table with SQL:\n{create_table_sql}")
         cursor.execute(create_table_sql)
         conn.commit()
+        table_created = True
+    
+    # Load appends into a staging heap and switch it in, when the target allows it
+    load_table = table_name
+    switching_in = False
+    if switch_in and table_exists and if_exists == "append":
+        blocker = switch_in_blocker(cursor, target)
+        if blocker:
+            logger.warning(f"Cannot switch into '{schema}.{table_name}' because {blocker}; appending directly")
+        else:
+            load_table = "stg_" + table_name
+            logger.info(f"Loading staging table '{schema}.{load_table}' to switch into '{schema}.{table_name}'")
+            # SELECT INTO copies the columns (and any identity) as a heap with no constraints
+            cursor.execute(f"SELECT TOP 0 * INTO {quote_identifier(schema)}.{quote_identifier(load_table)} FROM {target}")
+            conn.commit()
+            switching_in = True
+    load_target = f"{quote_identifier(schema)}.{quote_identifier(load_table)}"
+    
+    # Split the file across parallel loaders only into a new or empty target
+    parallel = False
+    if workers > 1:
+        if insert_engine != "pyodbc":
+            blocker = f"--engine {insert_engine} loads on a single connection"
+        elif switching_in:
+            blocker = "the rows are switched in from a staging table"
+        elif not quote_char.isascii() or f"\n{quote_char}".encode(encoding) != f"\n{quote_char}".encode("ascii"):
+            blocker = f"line breaks and quotes cannot be found by byte in {encoding}"
+        elif not table_created:
+            cursor.execute(f"SELECT TOP 1 1 FROM {target}")
+            blocker = "the target table is not empty" if cursor.fetchone() is not None else None
+        else:
+            blocker = None
+        if blocker:
+            logger.warning(f"Loading on one connection because {blocker}")
+        else:
+            parallel = True
     
     # Import data in chunks
     total_rows = 0
     
     # Prepare the INSERT statement template
     placeholders = ", ".join(["?" for _ in cleaned_columns])
-    columns_str = ", ".join([f"[{col}]" for col in cleaned_columns])
-    insert_sql = f"INSERT INTO [{schema}].[{table_name}] ({columns_str}) VALUES ({placeholders})"
-    
-    # Read and insert the data in chunks
-    logger.info("Starting data import...")
-    for i, chunk in enumerate(pd.read_csv(csv_path, chunksize=batch_size, encoding=encoding, delimiter=delimiter, low_memory=False)):
-        # Apply column name mapping
-        chunk.rename(columns=column_mapping, inplace=True)
-        
-        # Convert chunk to list of tuples for fast insertion
-        rows = [tuple(row) for row in chunk.values]
-        
-        # Insert batch of rows
-        start_batch = time.time()
-        cursor.fast_executemany = True  # Enable fast_executemany for better performance
-        cursor.executemany(insert_sql, rows)
-        conn.commit()
+    columns_str = ", ".join(quoted_columns)
+    # TABLOCK lets SQL Server minimally log inserts into the new heap, but its
+    # exclusive table lock would serialize parallel loaders, so they go without it
+    table_hint = "" if parallel else " WITH (TABLOCK)"
+    insert_sql = f"INSERT INTO {load_target}{table_hint} ({columns_str}) VALUES ({placeholders})"
+    
+    # Binding types are fixed by the table layout, so every batch reuses them
+    bindings = [binding_type_for(column_types[col]) for col in cleaned_columns]
+    
+    if insert_engine == "turbodbc":
+        # Separate turbodbc connection for column-wise parameter binding
+        turbo_conn = turbodbc.connect(
+            connection_string=connection_string,
+            turbodbc_options=turbodbc.make_options(use_async_io=True)
+        )
+        turbo_cursor = turbo_conn.cursor()
+        load_conn = turbo_conn
+    else:
+        load_conn = conn
+    
+    # Set up the cursor once; batches share a transaction until the next commit
+    conn.autocommit = False
+    cursor.fast_executemany = True  # Enable fast_executemany for better performance
+    commit_every = max(1, COMMIT_EVERY_ROWS // batch_size)
+    
+    # Continue the stream the sample was taken from, converting the text to the
+    # binding types on the reader thread
+    batches = (
+        convert_batch(batch, bindings)
+        for batch in iter_batches(itertools.chain([first_block], reader), batch_size)
+    )
+    # Parse the next batches on a reader thread while this one inserts
+    prefetched = prefetch_batches(batches)
+    try:
+        if parallel:
+            # Each worker re-parses its own byte range (the first one includes the
+            # sampled block) as text and converts it like the serial path
+            byte_ranges = split_byte_ranges(csv_path, workers, quote_char)
+            logger.info(f"Starting parallel import with {len(byte_ranges)} workers...")
+            stop = threading.Event()
+            with ThreadPoolExecutor(max_workers=len(byte_ranges)) as executor:
+                futures = [
+                    executor.submit(
+                        load_byte_range, connection_string, csv_path, byte_range, worker,
+                        insert_sql, bindings, batch_size, encoding, delimiter, quote_char,
+                        cleaned_columns, stop
+                    )
+                    for worker, byte_range in enumerate(byte_ranges, 1)
+                ]
+                total_rows = sum(future.result() for future in futures)
+        elif insert_engine == "bulk":
+            # Load the whole file server-side instead of binding rows
+            logger.info("Starting bulk load...")
+            total_rows = bulk_load_batches(
+                conn, connection_string, prefetched, schema, load_table,
+                cleaned_columns, column_types, bulk_dir=bulk_dir
+            )
+        else:
+            # Read and insert the data in chunks
+            logger.info("Starting data import...")
+            for i, batch in enumerate(prefetched):
+                if insert_engine == "turbodbc":
+                    # Hand typed NumPy buffers straight to the ODBC parameter arrays
+                    params = [to_masked_array(column, binding) for column, binding in zip(batch.columns, bindings)]
+                else:
+                    rows = to_rows(batch, bindings)
+                
+                # Insert batch of rows
+                start_batch = time.time()
+                if insert_engine == "turbodbc":
+                    turbo_cursor.executemanycolumns(insert_sql, params)
+                else:
+                    cursor.executemany(insert_sql, rows)
+                
+                # Commit every few batches rather than flushing the log for each one
+                if (i + 1) % commit_every == 0:
+                    load_conn.commit()
+                
+                batch_rows = batch.num_rows
+                total_rows += batch_rows
+                end_batch = time.time()
+                batch_time = end_batch - start_batch
+                
+                logger.info(f"Batch {i+1}: Inserted {batch_rows} rows in {batch_time:.2f} seconds ({batch_rows/batch_time:.2f} rows/sec)")
+                logger.info(f"Total progress: {total_rows} rows imported so far...")
+            
+            load_conn.commit()
         
-        batch_rows = len(rows)
-        total_rows += batch_rows
-        end_batch = time.time()
-        batch_time = end_batch - start_batch
+        if switching_in:
+            # Hand the loaded rows to the target as a metadata-only operation
+            logger.info(f"Switching '{schema}.{load_table}' into '{schema}.{table_name}'")
+            cursor.execute(f"ALTER TABLE {load_target} SWITCH TO {target}")
+            cursor.execute(f"DROP TABLE {load_target}")
+            conn.commit()
         
-        logger.info(f"Batch {i+1}: Inserted {batch_rows} rows in {batch_time:.2f} seconds ({batch_rows/batch_time:.2f} rows/sec)")
-        logger.info(f"Total progress: {total_rows} rows imported so far...")
-    
-    # Close the connection
-    conn.close()
+        if add_primary_key:
+            # Build the identity primary key once over the loaded heap
+            logger.info(f"Adding [Id] primary key to '{schema}.{table_name}'")
+            cursor.execute(f"ALTER TABLE {target} ADD [Id] INT IDENTITY(1,1) NOT NULL")
+            cursor.execute(f"ALTER TABLE {target} ADD CONSTRAINT {quote_identifier('PK_' + table_name)} PRIMARY KEY CLUSTERED ([Id])")
+            conn.commit()
+    except Exception:
+        if parallel:
+            # Workers commit on their own connections, so their rows are not rolled back here
+            conn.rollback()
+            if table_created:
+                logger.error(f"Parallel import failed; dropping the partly loaded table '{schema}.{table_name}'")
+                cursor.execute(f"DROP TABLE {target}")
+                conn.commit()
+            else:
+                logger.error(f"Parallel import failed; rows already committed by the workers remain in '{schema}.{table_name}'")
+            raise
+        logger.error(f"Import failed after {total_rows} rows; rolling back uncommitted batches")
+        load_conn.rollback()
+        if switching_in:
+            # The staging table was committed on its own, so clean it up explicitly
+            conn.rollback()
+            cursor.execute(f"IF OBJECT_ID(?, 'U') IS NOT NULL DROP TABLE {load_target}", load_target)
+            conn.commit()
+        raise
+    finally:
+        # Stop the reader thread before closing the reader under it, then the connections
+        prefetched.close()
+        reader.close()
+        if insert_engine == "turbodbc":
+            turbo_conn.close()
+        conn.close()
     
     end_time = datetime.now()
     duration = end_time - start_time
@@ -339,14 +1076,25 @@ def main():
                         help="ODBC Driver (default: ODBC Driver 17 for SQL Server)")
     parser.add_argument("--if-exists", choices=["fail", "replace", "append"], default="fail",
                         help="Action if table exists (default: fail)")
-    parser.add_argument("--batch-size", type=int, default=1000, 
-                        help="Size of batches for bulk insert (default: 1000)")
+    parser.add_argument("--batch-size", type=int, default=10000, 
+                        help="Size of batches for bulk insert (default: 10000)")
+    parser.add_argument("--auto-batch", action="store_true",
+                        help="Choose the batch size from the column count and row width")
     parser.add_argument("--infer-types", action="store_true", default=True,
                         help="Infer column types from data (default)")
     parser.add_argument("--no-infer-types", action="store_false", dest="infer_types",
                         help="Don't infer column types from data (use NVARCHAR for all)")
     parser.add_argument("--encoding", default="utf-8", help="File encoding (default: utf-8)")
-    parser.add_argument("--delimiter", default=",", help="CSV delimiter (default: ,)")
+    parser.add_argument("--delimiter", default=None,
+                        help="CSV delimiter (default: detected from the file)")
+    parser.add_argument("--engine", choices=["pyodbc", "turbodbc", "bulk"], default="pyodbc",
+                        help="Insert engine: row-wise pyodbc, column-wise turbodbc, or bulk (BULK INSERT/bcp) (default: pyodbc)")
+    parser.add_argument("--bulk-dir",
+                        help="Directory readable by SQL Server (e.g. a UNC share) for BULK INSERT; bcp is used if omitted")
+    parser.add_argument("--switch-in", action="store_true",
+                        help="With --if-exists append, load a staging heap and switch it into the table")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Parallel loaders for a new or empty table, each on its own connection (default: 1)")
     
     args = parser.parse_args()
     
@@ -376,7 +1124,12 @@ def main():
             batch_size=args.batch_size,
             infer_types=args.infer_types,
             encoding=args.encoding,
-            delimiter=args.delimiter
+            delimiter=args.delimiter,
+            insert_engine=args.engine,
+            bulk_dir=args.bulk_dir,
+            auto_batch=args.auto_batch,
+            switch_in=args.switch_in,
+            workers=args.workers
         )
         
         logger.info(f"Successfully imported {rows_imported} rows into table '{args.schema}.{args.table}'")
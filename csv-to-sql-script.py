@@ -19,18 +19,24 @@ Options:
     --chunksize CHUNKSIZE Size of chunks to process at once (default: 1000)
     --no-infer-types      Don't infer column types from data (use string for all)
     --encoding ENCODING   File encoding (default: utf-8)
-    --delimiter DELIMITER CSV delimiter (default: ,)
+    --delimiter DELIMITER CSV delimiter (default: detected from the file)
 """
 
 import os
 import sys
 import argparse
+import csv
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pacsv
 import sqlalchemy
-from sqlalchemy import create_engine, inspect
+from sqlalchemy import create_engine, inspect, text
 import logging
+import itertools
+import re
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 # Set up logging
 logging.basicConfig(
@@ -39,6 +45,63 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Bytes handed to the Arrow CSV tokenizer per block
+READ_BLOCK_SIZE = 8 << 20
+
+# Characters of the file handed to csv.Sniffer, and the delimiters it may choose from
+SNIFF_SAMPLE_SIZE = 64 << 10
+SNIFF_DELIMITERS = ",;\t|"
+
+# Cheap test for values worth handing to pd.to_datetime (year-first or year-last dates)
+_DATELIKE = re.compile(r'^(\d{4}[-/]\d{1,2}[-/]\d{1,2}|\d{1,2}[-/]\d{1,2}[-/]\d{4})')
+
+# Whole numbers, recognized lexically so long ones are not rounded through float
+_INTEGER = re.compile(r'[-+]?[0-9]+')
+
+# Integer type for each width to_numeric can downcast to
+_INTEGER_TYPES = {
+    1: sqlalchemy.SmallInteger,
+    2: sqlalchemy.SmallInteger,
+    4: sqlalchemy.Integer,
+    8: sqlalchemy.BigInteger,
+}
+
+# Exact formats for ISO-style dates, so pd.to_datetime can skip format guessing
+_DATE_FORMATS = [
+    (re.compile(r'^\d{4}-\d{1,2}-\d{1,2}$'), '%Y-%m-%d'),
+    (re.compile(r'^\d{4}-\d{1,2}-\d{1,2} \d{1,2}:\d{2}:\d{2}$'), '%Y-%m-%d %H:%M:%S'),
+    (re.compile(r'^\d{4}-\d{1,2}-\d{1,2} \d{1,2}:\d{2}:\d{2}\.\d+$'), '%Y-%m-%d %H:%M:%S.%f'),
+    (re.compile(r'^\d{4}-\d{1,2}-\d{1,2}T\d{1,2}:\d{2}:\d{2}$'), '%Y-%m-%dT%H:%M:%S'),
+    (re.compile(r'^\d{4}-\d{1,2}-\d{1,2}T\d{1,2}:\d{2}:\d{2}\.\d+$'), '%Y-%m-%dT%H:%M:%S.%f'),
+]
+
+# Arrow type the text of each inferred column type is converted to before
+# import; anything not listed here is imported as text
+COLUMN_CONVERSIONS = {
+    sqlalchemy.SmallInteger: pa.int64(),
+    sqlalchemy.Integer: pa.int64(),
+    sqlalchemy.BigInteger: pa.int64(),
+    sqlalchemy.Float: pa.float64(),
+    sqlalchemy.DateTime: pa.timestamp("us"),
+}
+
+# Bind parameters allowed per statement, by dialect (sqlite's compile-time default
+# is 999; SQL Server rejects statements with 2100 or more)
+MAX_BIND_PARAMS = {"sqlite": 999, "mssql": 2099}
+DEFAULT_MAX_BIND_PARAMS = 32767
+
+# Row value expressions allowed in one INSERT ... VALUES, by dialect
+MAX_ROWS_PER_STATEMENT = {"mssql": 1000}
+
+def detect_date_format(value):
+    """
+    Return the strptime format matching an ISO-style date string, or None.
+    """
+    for pattern, date_format in _DATE_FORMATS:
+        if pattern.match(value):
+            return date_format
+    return None
+
 def infer_sql_column_type(column_values):
     """
     Infer SQL column type from a pandas Series of values.
@@ -49,100 +112,265 @@ def infer_sql_column_type(column_values):
     if len(sample) == 0:
         return sqlalchemy.String
     
-    # Check if all values are numeric
-    try:
-        if pd.to_numeric(sample, errors='coerce').notna().all():
-            # Check if all values are integers
-            if pd.Series([float(x).is_integer() for x in sample if pd.notna(x)]).all():
-                # Check range for appropriate integer size
-                min_val = min(sample.astype(float))
-                max_val = max(sample.astype(float))
-                if min_val >= -32768 and max_val <= 32767:
-                    return sqlalchemy.SmallInteger
-                elif min_val >= -2147483648 and max_val <= 2147483647:
-                    return sqlalchemy.Integer
+    # Render values as strings once for the date and length checks
+    as_str = sample.astype(str)
+    
+    # Check if all values are integers, and size them by the narrowest dtype they fit
+    if as_str.str.fullmatch(_INTEGER).all():
+        ints = pd.to_numeric(as_str, downcast='integer')
+        if ints.dtype.kind == 'i':
+            return _INTEGER_TYPES[ints.dtype.itemsize]
+        # Beyond BigInteger, keep values exact as whole-number Numeric
+        digits = int((as_str.str.len() - as_str.str.match('[-+]')).max())
+        return sqlalchemy.Numeric(digits, 0)
+    else:
+        # Check if all values are numeric
+        try:
+            nums = pd.to_numeric(sample, errors='coerce')
+            if nums.notna().all():
+                # Check if all values are integers
+                if ((nums % 1) == 0).all():
+                    # Check range for appropriate integer size
+                    min_val = nums.min()
+                    max_val = nums.max()
+                    if min_val >= -32768 and max_val <= 32767:
+                        return sqlalchemy.SmallInteger
+                    elif min_val >= -2147483648 and max_val <= 2147483647:
+                        return sqlalchemy.Integer
+                    else:
+                        return sqlalchemy.BigInteger
                 else:
-                    return sqlalchemy.BigInteger
-            else:
-                return sqlalchemy.Float
-    except:
-        pass
+                    return sqlalchemy.Float
+        except:
+            pass
     
-    # Check if all values are dates
-    try:
-        if pd.to_datetime(sample, errors='coerce').notna().all():
-            return sqlalchemy.DateTime
-    except:
-        pass
+    # Check if all values are dates, unless the first one clearly isn't
+    first_value = as_str.iat[0]
+    if _DATELIKE.match(first_value):
+        try:
+            if pd.to_datetime(as_str, format=detect_date_format(first_value), errors='coerce').notna().all():
+                return sqlalchemy.DateTime
+        except:
+            pass
     
     # Default to string, with appropriate length
-    max_len = sample.astype(str).str.len().max()
+    max_len = as_str.str.len().max()
     if max_len <= 255:
         return sqlalchemy.String(max_len)
     else:
         return sqlalchemy.Text
 
+def sniff_dialect(csv_path, encoding="utf-8"):
+    """
+    Guess the delimiter and quote character from the start of the CSV file.
+    Falls back to a comma and double quotes if the sample is ambiguous.
+    """
+    with open(csv_path, newline="", encoding=encoding) as f:
+        sample = f.read(SNIFF_SAMPLE_SIZE)
+    # Only sniff whole lines, as a truncated last row can skew the guess
+    if len(sample) == SNIFF_SAMPLE_SIZE and "\n" in sample:
+        sample = sample[:sample.rindex("\n") + 1]
+    try:
+        dialect = csv.Sniffer().sniff(sample, delimiters=SNIFF_DELIMITERS)
+        return dialect.delimiter, dialect.quotechar or '"'
+    except csv.Error:
+        return ",", '"'
+
+def read_header(csv_path, encoding="utf-8", delimiter=",", quote_char='"'):
+    """
+    Read just the header row of the CSV file.
+    """
+    with open(csv_path, newline="", encoding=encoding) as f:
+        header = next(csv.reader(f, delimiter=delimiter, quotechar=quote_char), [])
+    if header:
+        header[0] = header[0].lstrip("\ufeff")
+    return header
+
+def open_csv_reader(csv_path, encoding="utf-8", delimiter=",", quote_char='"', column_names=None):
+    """
+    Open a streaming Arrow reader over the CSV file.
+    Empty cells are read as NULL, matching pandas. If column_names is given,
+    the header row is skipped, the batches carry those names instead, and
+    every column is read as text, so Arrow's guess from the first block never
+    becomes a schema that later blocks can fail.
+    """
+    if column_names:
+        read_options = pacsv.ReadOptions(block_size=READ_BLOCK_SIZE, encoding=encoding,
+                                         column_names=column_names, skip_rows=1)
+        column_types = dict.fromkeys(column_names, pa.string())
+    else:
+        read_options = pacsv.ReadOptions(block_size=READ_BLOCK_SIZE, encoding=encoding)
+        column_types = None
+    return pacsv.open_csv(
+        csv_path,
+        read_options=read_options,
+        parse_options=pacsv.ParseOptions(delimiter=delimiter, quote_char=quote_char,
+                                         newlines_in_values=True),
+        convert_options=pacsv.ConvertOptions(strings_can_be_null=True, column_types=column_types)
+    )
+
+def conversion_type_for(sql_type):
+    """
+    Return the Arrow type a column's text is converted to, or None to keep it as text.
+    """
+    return COLUMN_CONVERSIONS.get(sql_type if isinstance(sql_type, type) else type(sql_type))
+
+def cast_text(column, arrow_type):
+    """
+    Cast a text column to arrow_type; integers written like 1.0 or +7 are
+    parsed through float64. Raises ArrowInvalid if any value does not convert.
+    """
+    try:
+        return column.cast(arrow_type)
+    except pa.ArrowInvalid:
+        if not pa.types.is_integer(arrow_type):
+            raise
+        return column.cast(pa.float64()).cast(arrow_type)
+
+def convert_batch(batch, conversions):
+    """
+    Convert the text columns of a RecordBatch to their inferred Arrow types.
+    A column that does not convert in this batch is left as text for the
+    database to store or reject, as pandas would, instead of failing the import.
+    """
+    columns = []
+    for name, column, arrow_type in zip(batch.schema.names, batch.columns, conversions):
+        if arrow_type is not None and pa.types.is_string(column.type):
+            try:
+                column = cast_text(column, arrow_type)
+            except pa.ArrowInvalid:
+                logger.warning(f"Column '{name}' has values that are not {arrow_type} in this chunk; importing them as text")
+        columns.append(column)
+    return pa.RecordBatch.from_arrays(columns, names=batch.schema.names)
+
+def iter_chunks(batches, chunksize, conversions):
+    """
+    Yield DataFrames of at most chunksize rows from a stream of Arrow RecordBatches,
+    with each column converted to its entry in conversions.
+    """
+    for batch in batches:
+        for offset in range(0, batch.num_rows, chunksize):
+            yield convert_batch(batch.slice(offset, chunksize), conversions).to_pandas()
+
+def text_sample(column):
+    """
+    Render an Arrow column as a pandas Series of strings for type inference.
+    """
+    return column.cast(pa.string()).to_pandas()
+
+def qualified_table_name(preparer, schema, table_name):
+    """
+    Quote a table name, and its schema if given, for the connection's dialect.
+    """
+    if schema:
+        return f"{preparer.quote_schema(schema)}.{preparer.quote(table_name)}"
+    return preparer.quote(table_name)
+
+def insert_with_execute_values(table, conn, keys, data_iter):
+    """
+    to_sql insert method for PostgreSQL that sends rows with psycopg2's execute_values.
+    """
+    from psycopg2.extras import execute_values
+    preparer = conn.dialect.identifier_preparer
+    target = qualified_table_name(preparer, table.schema, table.name)
+    columns = ", ".join(preparer.quote(key) for key in keys)
+    with conn.connection.cursor() as cursor:
+        execute_values(cursor, f"INSERT INTO {target} ({columns}) VALUES %s", data_iter, page_size=1000)
+
+def insert_options(dialect, num_columns, chunksize):
+    """
+    Choose the to_sql insert method and rows per statement for a dialect.
+    Multi-row VALUES statements are kept under the dialect's bind-parameter
+    and row limits.
+    """
+    if dialect.name == "postgresql":
+        return insert_with_execute_values, chunksize
+    max_params = MAX_BIND_PARAMS.get(dialect.name, DEFAULT_MAX_BIND_PARAMS)
+    rows = min(chunksize, max_params // max(1, num_columns))
+    if dialect.name in MAX_ROWS_PER_STATEMENT:
+        rows = min(rows, MAX_ROWS_PER_STATEMENT[dialect.name])
+    return "multi", max(1, rows)
+
 def create_table_from_csv(engine, csv_path, table_name, schema="public", 
                          if_exists="fail", chunksize=1000, infer_types=True,
-                         encoding="utf-8", delimiter=","):
+                         encoding="utf-8", delimiter=None):
     """
     Create a SQL table from a CSV file and import data.
     """
     start_time = datetime.now()
     
-    # Read the first chunk to get column names and sample data for type inference
+    # Clean column names once from the header (replace spaces with underscores, etc.),
+    # so every chunk is read under them
     logger.info(f"Reading CSV file: {csv_path}")
-    first_chunk = pd.read_csv(csv_path, nrows=chunksize, encoding=encoding, delimiter=delimiter)
+    # Sniff the dialect once unless a delimiter was given
+    if delimiter is None:
+        delimiter, quote_char = sniff_dialect(csv_path, encoding=encoding)
+        logger.info(f"Detected delimiter {delimiter!r} and quote character {quote_char!r}")
+    else:
+        quote_char = '"'
+    header = read_header(csv_path, encoding=encoding, delimiter=delimiter, quote_char=quote_char)
+    columns = [col.strip().lower().replace(' ', '_') for col in header]
     
-    # Clean column names (replace spaces with underscores, etc.)
-    first_chunk.columns = [col.strip().lower().replace(' ', '_') for col in first_chunk.columns]
+    # Read the first block to get sample data for type inference;
+    # the same block is imported first, so the file is only parsed once
+    reader = open_csv_reader(csv_path, encoding=encoding, delimiter=delimiter,
+                             quote_char=quote_char, column_names=columns)
+    try:
+        first_block = reader.read_next_batch()
+    except StopIteration:
+        first_block = pa.RecordBatch.from_pylist([], schema=reader.schema)
+    first_batch = first_block.slice(0, chunksize)
     
     # Set up SQL column types
     if infer_types:
         logger.info("Inferring column types from data")
-        dtype_dict = {col: infer_sql_column_type(first_chunk[col]) for col in first_chunk.columns}
+        # Columns are independent and pandas drops the GIL in its vectorized kernels
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            inferred = executor.map(lambda column: infer_sql_column_type(text_sample(column)), first_batch.columns)
+            dtype_dict = dict(zip(columns, inferred))
     else:
         dtype_dict = None  # Will default to string/text types
     
-    # Check if table exists
-    inspector = inspect(engine)
-    table_exists = table_name in inspector.get_table_names(schema=schema)
-    
-    if table_exists and if_exists == "fail":
-        logger.error(f"Table '{table_name}' already exists. Use --if-exists option.")
-        sys.exit(1)
-    elif table_exists and if_exists == "replace":
-        logger.info(f"Dropping existing table '{table_name}'")
-        engine.execute(f"DROP TABLE IF EXISTS {schema}.{table_name}")
-    
-    # Import data in chunks
-    total_rows = 0
-    
-    if if_exists == "append" and table_exists:
-        # Just append to existing table
-        logger.info(f"Appending data to existing table '{table_name}'")
-        for chunk in pd.read_csv(csv_path, chunksize=chunksize, encoding=encoding, delimiter=delimiter):
-            chunk.columns = [col.strip().lower().replace(' ', '_') for col in chunk.columns]
-            chunk.to_sql(table_name, engine, schema=schema, if_exists="append", index=False)
-            total_rows += len(chunk)
-            logger.info(f"Imported {total_rows} rows so far...")
-    else:
-        # Create new table
-        logger.info(f"Creating table '{table_name}' and importing data")
-        for i, chunk in enumerate(pd.read_csv(csv_path, chunksize=chunksize, encoding=encoding, delimiter=delimiter)):
-            chunk.columns = [col.strip().lower().replace(' ', '_') for col in chunk.columns]
-            
-            if i == 0:
-                # Create table with first chunk
-                chunk.to_sql(table_name, engine, schema=schema, if_exists="replace", 
-                            index=False, dtype=dtype_dict)
-            else:
-                # Append remaining chunks
-                chunk.to_sql(table_name, engine, schema=schema, if_exists="append", 
-                            index=False)
-            
+    # Run the whole import on one connection and transaction
+    with engine.begin() as conn:
+        # Check if table exists
+        inspector = inspect(conn)
+        table_exists = table_name in inspector.get_table_names(schema=schema)
+        
+        if table_exists and if_exists == "fail":
+            logger.error(f"Table '{table_name}' already exists. Use --if-exists option.")
+            reader.close()
+            sys.exit(1)
+        elif table_exists and if_exists == "replace":
+            logger.info(f"Dropping existing table '{table_name}'")
+            qualified_name = qualified_table_name(conn.dialect.identifier_preparer, schema, table_name)
+            conn.execute(text(f"DROP TABLE IF EXISTS {qualified_name}"))
+        
+        # Import data in chunks, continuing the stream the sample was taken from
+        total_rows = 0
+        conversions = [conversion_type_for(dtype_dict[col]) if dtype_dict else None for col in columns]
+        chunks = iter_chunks(itertools.chain([first_block], reader), chunksize, conversions)
+        method, rows_per_statement = insert_options(conn.dialect, len(columns), chunksize)
+        
+        if if_exists == "append" and table_exists:
+            # Just append to existing table
+            logger.info(f"Appending data to existing table '{table_name}'")
+        else:
+            # Create the table once up front, then append every chunk to it
+            logger.info(f"Creating table '{table_name}' and importing data")
+            table = sqlalchemy.Table(
+                table_name, sqlalchemy.MetaData(),
+                *[sqlalchemy.Column(col, dtype_dict[col] if dtype_dict else sqlalchemy.Text) for col in columns],
+                schema=schema
+            )
+            table.create(conn)
+        
+        for chunk in chunks:
+            chunk.to_sql(table_name, conn, schema=schema, if_exists="append", index=False,
+                         method=method, chunksize=rows_per_statement)
             total_rows += len(chunk)
             logger.info(f"Imported {total_rows} rows so far...")
+    reader.close()
     
     end_time = datetime.now()
     duration = end_time - start_time
@@ -164,7 +392,8 @@ def main():
     parser.add_argument("--no-infer-types", action="store_true", 
                         help="Don't infer column types from data")
     parser.add_argument("--encoding", default="utf-8", help="File encoding (default: utf-8)")
-    parser.add_argument("--delimiter", default=",", help="CSV delimiter (default: ,)")
+    parser.add_argument("--delimiter", default=None,
+                        help="CSV delimiter (default: detected from the file)")
     
     args = parser.parse_args()
     